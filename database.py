@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import async_sessionmaker
 from datetime import datetime, UTC
 from sqlalchemy import ForeignKey
 from sqlalchemy import Column, Integer, String, Boolean, Float, DateTime, ForeignKey
+from sqlalchemy import Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -34,11 +35,14 @@ class Website(Base):
     last_checked: Mapped[datetime] = mapped_column(default=lambda: datetime.now(UTC))
     last_notification_sent: Mapped[datetime] = mapped_column(nullable=True)
     server_info_id: Mapped[int] = mapped_column(ForeignKey("server_info.id"), nullable=True)
-    server_info: Mapped["ServerInfo"] = relationship("ServerInfo", back_populates="website")
+    server_info: Mapped["ServerInfo"] = relationship("ServerInfo", back_populates="websites")
 
-# Server Info model
+# Server Info model - one row per monitored server, shared by every website hosted on it
 class ServerInfo(Base):
     __tablename__ = "server_info"
+    __table_args__ = (
+        Index("ix_server_info_host_username", "host", "username", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     host: Mapped[str] = mapped_column(index=True)
@@ -55,7 +59,7 @@ class ServerInfo(Base):
     last_cpu_alert: Mapped[datetime] = mapped_column(nullable=True)
     last_ram_alert: Mapped[datetime] = mapped_column(nullable=True)
     last_disk_alert: Mapped[datetime] = mapped_column(nullable=True)
-    website: Mapped["Website"] = relationship("Website", back_populates="server_info")
+    websites: Mapped[list["Website"]] = relationship("Website", back_populates="server_info")
 
 # Async context manager for database sessions
 async def get_db():
@@ -71,7 +75,53 @@ async def init_db():
         await conn.run_sync(Base.metadata.create_all)
     await engine.dispose()
 
+# Merge duplicate server_info rows (same host and username) left over from when
+# each website had its own copy, then enforce uniqueness going forward
+async def migrate_server_info(conn):
+    result = await conn.execute(text(
+        "SELECT id, host, username, last_cpu_alert, last_ram_alert, last_disk_alert "
+        "FROM server_info ORDER BY last_checked DESC, id DESC"
+    ))
+    groups = {}
+    for row in result.mappings():
+        groups.setdefault((row["host"], row["username"]), []).append(row)
+
+    for rows in groups.values():
+        if len(rows) < 2:
+            continue
+        # Keep the most recently checked row and carry over the latest alert times
+        # so merged servers don't re-send alerts that are still in cooldown
+        keep_id = rows[0]["id"]
+        duplicate_ids = [row["id"] for row in rows[1:]]
+        alerts = {
+            column: max((row[column] for row in rows if row[column]), default=None)
+            for column in ("last_cpu_alert", "last_ram_alert", "last_disk_alert")
+        }
+        await conn.execute(
+            text(
+                "UPDATE server_info SET last_cpu_alert = :last_cpu_alert, "
+                "last_ram_alert = :last_ram_alert, last_disk_alert = :last_disk_alert "
+                "WHERE id = :keep_id"
+            ),
+            {"keep_id": keep_id, **alerts}
+        )
+        for duplicate_id in duplicate_ids:
+            await conn.execute(
+                text("UPDATE websites SET server_info_id = :keep_id WHERE server_info_id = :duplicate_id"),
+                {"keep_id": keep_id, "duplicate_id": duplicate_id}
+            )
+            await conn.execute(
+                text("DELETE FROM server_info WHERE id = :duplicate_id"),
+                {"duplicate_id": duplicate_id}
+            )
+
+    await conn.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_server_info_host_username "
+        "ON server_info (host, username)"
+    ))
+
 # Create tables
 async def init_db():
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all) 
\ No newline at end of file
+        await conn.run_sync(Base.metadata.create_all)
+        await migrate_server_info(conn)
\ No newline at end of file
@@ -35,7 +35,7 @@ async def send_notification_email(website_url: str, status: bool) -> bool:
         return False
 
 async def send_resource_alert(
-    website_url: str,
+    website_urls: list[str],
     host: str,
     resource_type: Literal["CPU", "RAM", "Disk"],
     usage: float,
@@ -50,7 +50,7 @@ async def send_resource_alert(
         body = f"""
         Server Resource Alert
 
-        Website: {website_url}
+        Websites: {', '.join(website_urls)}
         Server: {host}
         Alert: {resource_type} usage has exceeded {threshold}%
         Current Usage: {usage:.1f}%
@@ -92,13 +92,13 @@ async def is_authenticated(request: Request):
     return True
 
 async def check_and_send_resource_alert(
-    website: Website,
+    website_urls: list[str],
     server: ServerInfo,
     resource_type: str,
     usage: float,
     last_alert: datetime | None
 ) -> bool:
-    """Check if resource usage exceeds threshold and send alert if needed"""
+    """Check if resource usage exceeds threshold and send a single alert for all linked websites"""
     # Get the appropriate threshold based on resource type
     threshold = {
         "CPU": server.cpu_threshold,
@@ -110,7 +110,7 @@ async def check_and_send_resource_alert(
         not last_alert or 
         (datetime.now(UTC) - last_alert.replace(tzinfo=UTC)).total_seconds() > RESOURCE_ALERT_COOLDOWN
     ):
-        if await send_resource_alert(website.url, server.host, resource_type, usage, threshold):
+        if await send_resource_alert(website_urls, server.host, resource_type, usage, threshold):
             return True
     return False
 
@@ -166,34 +166,6 @@ async def check_all_websites_background():
                             website.status = status
                             website.last_checked = current_time
                             
-                            # Check server metrics if server info is available
-                            if website.server_info:
-                                server = website.server_info
-                                cpu, ram, disk = await get_server_metrics(
-                                    server.host,
-                                    server.username,
-                                    server.password,
-                                    server.ssh_key_path
-                                )
-                                
-                                if cpu is not None:
-                                    server.cpu_usage = cpu
-                                    server.ram_usage = ram
-                                    server.disk_usage = disk
-                                    server.last_checked = current_time
-                                    
-                                    # Only send resource alerts if notifications are enabled
-                                    if website.notify_on_down:
-                                        # Check and send resource alerts if needed
-                                        if await check_and_send_resource_alert(website, server, "CPU", cpu, server.last_cpu_alert):
-                                            server.last_cpu_alert = current_time
-                                        
-                                        if await check_and_send_resource_alert(website, server, "RAM", ram, server.last_ram_alert):
-                                            server.last_ram_alert = current_time
-                                        
-                                        if await check_and_send_resource_alert(website, server, "Disk", disk, server.last_disk_alert):
-                                            server.last_disk_alert = current_time
-                            
                             # Send notification if website is down and notifications are enabled
                             if website.notify_on_down and not status and (
                                 not website.last_notification_sent or 
@@ -202,8 +174,57 @@ async def check_all_websites_background():
                                 if await send_notification_email(website.url, status):
                                     website.last_notification_sent = current_time
                         
+                        # Group websites by server (host and username) so each server is only polled once per cycle
+                        servers = {}
+                        for website in websites:
+                            if website.server_info:
+                                servers.setdefault(website.server_info.id, (website.server_info, []))[1].append(website)
+                        
+                        metrics = await asyncio.gather(
+                            *[
+                                get_server_metrics(
+                                    server.host,
+                                    server.username,
+                                    server.password,
+                                    server.ssh_key_path
+                                )
+                                for server, _ in servers.values()
+                            ],
+                            return_exceptions=True
+                        )
+                        
+                        for (server, linked_websites), server_metrics in zip(servers.values(), metrics):
+                            # An unreachable server must not abort the cycle for every other website
+                            if isinstance(server_metrics, Exception):
+                                logger.error(f"Error getting metrics from {server.host}: {str(server_metrics)}")
+                                continue
+                            
+                            cpu, ram, disk = server_metrics
+                            if cpu is None:
+                                continue
+                            
+                            server.cpu_usage = cpu
+                            server.ram_usage = ram
+                            server.disk_usage = disk
+                            server.last_checked = current_time
+                            
+                            # Only send resource alerts for websites with notifications enabled
+                            notify_urls = [website.url for website in linked_websites if website.notify_on_down]
+                            if not notify_urls:
+                                continue
+                            
+                            # Check and send resource alerts if needed
+                            if await check_and_send_resource_alert(notify_urls, server, "CPU", cpu, server.last_cpu_alert):
+                                server.last_cpu_alert = current_time
+                            
+                            if ram is not None and await check_and_send_resource_alert(notify_urls, server, "RAM", ram, server.last_ram_alert):
+                                server.last_ram_alert = current_time
+                            
+                            if disk is not None and await check_and_send_resource_alert(notify_urls, server, "Disk", disk, server.last_disk_alert):
+                                server.last_disk_alert = current_time
+                        
                         await db.commit()
-                        logger.info(f"Auto-checked {len(websites)} websites")
+                        logger.info(f"Auto-checked {len(websites)} websites on {len(servers)} servers")
                 except Exception as e:
                     logger.error(f"Error in background check: {str(e)}")
                     await db.rollback()
@@ -271,10 +292,18 @@ async def remove_website(
     _: bool = Depends(is_authenticated)
 ):
     # Find and remove website
-    result = await db.execute(select(Website).where(Website.url == url))
+    result = await db.execute(
+        select(Website)
+        .options(selectinload(Website.server_info).selectinload(ServerInfo.websites))
+        .where(Website.url == url)
+    )
     website = result.scalar_one_or_none()
     if website:
+        server_info = website.server_info
         await db.delete(website)
+        # Remove the server too if no other website is linked to it
+        if server_info and len(server_info.websites) == 1:
+            await db.delete(server_info)
         await db.commit()
     return {"success": True}
 
@@ -309,7 +338,7 @@ async def add_server_info(
     # Find the website with server info
     result = await db.execute(
         select(Website)
-        .options(selectinload(Website.server_info))
+        .options(selectinload(Website.server_info).selectinload(ServerInfo.websites))
         .where(Website.url == url)
     )
     website = result.scalar_one_or_none()
@@ -317,11 +346,24 @@ async def add_server_info(
     if not website:
         raise HTTPException(status_code=404, detail="Website not found")
     
-    # Create or update server info
-    if website.server_info:
+    # Reuse the server if another website on the same host is already linked to it
+    result = await db.execute(
+        select(ServerInfo)
+        .options(selectinload(ServerInfo.websites))
+        .where(ServerInfo.host == host, ServerInfo.username == username)
+    )
+    server_info = result.scalar_one_or_none()
+    
+    if server_info is None and website.server_info and len(website.server_info.websites) == 1:
+        # Website was the only one on its old server, so update that server in place
         server_info = website.server_info
         server_info.host = host
         server_info.username = username
+    
+    previous_server = website.server_info
+    
+    # Create or update server info
+    if server_info:
         server_info.cpu_threshold = cpu_threshold
         server_info.ram_threshold = ram_threshold
         server_info.disk_threshold = disk_threshold
@@ -339,7 +381,11 @@ async def add_server_info(
             ram_threshold=ram_threshold,
             disk_threshold=disk_threshold
         )
-        website.server_info = server_info
+    website.server_info = server_info
+    
+    # Remove the old server if this website was the last one linked to it
+    if previous_server and previous_server is not server_info and not previous_server.websites:
+        await db.delete(previous_server)
     
     await db.commit()
     return {"success": True}